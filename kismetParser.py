@@ -2,186 +2,368 @@
 
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-import json
+from functools import lru_cache
 import logging
+import os
 from pathlib import Path
 import sys
 from tabulate import tabulate, tabulate_formats
+from typing import Any, Callable, TypedDict
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    from orjson import loads as jsonLoads
+except ImportError:
+    from json import loads as jsonLoads
 
 
 logger = logging.getLogger(__name__)
 
 
+class _Dot11Record(TypedDict, total=False):
+    """Subset of a Kismet 802.11 device record read by the parser"""
+    dot11_device_last_beaconed_ssid_record: Any
+    dot11_device_last_bssid: Any
+    dot11_device_last_probed_ssid_record: Any
+
+
+class _DeviceRecord(TypedDict, total=False):
+    """Subset of a Kismet device record read by the parser"""
+    kismet_device_base_type: Any
+    kismet_device_base_macaddr: Any
+    kismet_device_base_first_time: Any
+    kismet_device_base_last_time: Any
+    kismet_device_base_manuf: Any
+    kismet_device_base_name: Any
+    kismet_device_base_channel: Any
+    kismet_device_base_crypt: Any
+    kismet_device_base_signal: Any
+    dot11_device: _Dot11Record
+
+
+if msgspec is not None:
+    # Only the fields above are decoded, the rest of each record is skipped
+    _decodeRecord = msgspec.json.Decoder(_DeviceRecord).decode
+    _invalidRecordErrors = (msgspec.ValidationError,)
+else:
+    _decodeRecord = jsonLoads
+    _invalidRecordErrors = ()
+
+
+@lru_cache(maxsize=8192)
+def _epochToDatetime(epoch: int) -> str:
+    """Converts and epoch value to a readable datetime string, caching
+    results as first and last seen times tend to recur across devices
+    @param epoch: Epoch value to convert
+    @return: Readable datetime string
+    """
+    return datetime.fromtimestamp(epoch).strftime('%Y-%m-%d %H:%M:%S')
+
+def _loadDevice(line: bytes) -> Any:
+    """Decodes a device record from a line of EKJSON, records that don't match
+    the expected schema are decoded in full so that they are handled the same
+    whether or not msgspec is installed
+    @param line: Line of EKJSON to decode
+    @return: Decoded device record
+    """
+    try:
+        return _decodeRecord(line)
+    except _invalidRecordErrors:
+        return jsonLoads(line)
+
+def _signalSortKey(item: tuple) -> tuple:
+    """Generates a key for sorting device records by signal strength,
+    strongest first with unknown signals last, then by MAC address
+    @param item: Tuple of MAC address and device record
+    @return: Sort key
+    """
+    mac, device = item
+    return min(device.rssiMagnitude, 256), mac
+
+def _signalStrength(device: dict) -> tuple:
+    """Extracts the maximum signal reading from a device record
+    @param device: Dictionary containing device data
+    @return: Tuple of the signal reading as reported and its magnitude, 5000
+    for both denotes an unknown signal
+    """
+    sig = device.get('kismet_device_base_signal')
+    if not isinstance(sig, dict):
+        return 5000, 5000
+    rssi = sig.get('kismet_common_signal_max_signal')
+    if rssi is None or \
+        str(sig.get('kismet_common_signal_type')).lower() == "none":
+        return 5000, 5000
+    try:
+        rssi = int(rssi)
+    except (TypeError, ValueError):
+        return 5000, 5000
+    return rssi, abs(rssi)
+
+
+@dataclass(slots=True)
+class BluetoothDevice():
+    """Bluetooth device record, RSSI is stored as reported alongside its
+    magnitude for comparisons, 5000 denotes an unknown signal
+    """
+    firstTime: int
+    lastTime: int
+    manufacturer: str
+    name: str
+    rssi: int
+    rssiMagnitude: int
+
+
+@dataclass(slots=True)
+class WirelessAp():
+    """Wireless access point device record, RSSI is stored as reported
+    alongside its magnitude for comparisons, 5000 denotes an unknown signal
+    """
+    firstTime: int
+    lastTime: int
+    manufacturer: str
+    channel: int
+    auth: str
+    essid: str
+    rssi: int
+    rssiMagnitude: int
+
+
+@dataclass(slots=True)
+class WirelessClient():
+    """Wireless client device record, RSSI is stored as reported alongside
+    its magnitude for comparisons, 5000 denotes an unknown signal
+    """
+    firstTime: int
+    lastTime: int
+    manufacturer: str
+    bssid: str
+    probedSsids: set
+    rssi: int
+    rssiMagnitude: int
+
+
 class KismetParser():
     """Kismet parser object"""
 
     def __init__(self) -> None:
         """Initialises a Kismet parser object"""
-        self.devices = []
         self.bluetoothDevices = {}
         self.wirelessAps = {}
         self.wirelessClients = {}
+        self._essidPool = {}
         logger.debug("Kismet parser initialised")
 
-    def _epochToDatetime(self, epoch: int) -> str:
-        """Converts and epoch value to a readable datetime string
-        @param epoch: Epoch value to convert
-        @return: Readable datetime string
+    def _addBluetooth(self, mac: str, device: BluetoothDevice) -> None:
+        """Adds a bluetooth device record, merging it with any existing record
+        for the same MAC address
+        @param mac: MAC address of the device
+        @param device: Device record to add
         """
-        return datetime.fromtimestamp(epoch).strftime('%Y-%m-%d %H:%M:%S')
+        new = self.bluetoothDevices.get(mac)
+        if new is None:
+            self.bluetoothDevices[mac] = device
+        else:
+            if device.firstTime < new.firstTime:
+                new.firstTime = device.firstTime
+            if device.lastTime > new.lastTime:
+                new.lastTime = device.lastTime
+            if device.manufacturer != new.manufacturer or \
+                device.name != new.name:
+                logger.warning("Conflicting information for %s", mac)
+
+    def _addWirelessAp(self, mac: str, device: WirelessAp) -> None:
+        """Adds a wireless access point device record, merging it with any
+        existing record for the same MAC address
+        @param mac: MAC address of the device
+        @param device: Device record to add
+        """
+        new = self.wirelessAps.get(mac)
+        if new is None:
+            self.wirelessAps[mac] = device
+        else:
+            if device.firstTime < new.firstTime:
+                new.firstTime = device.firstTime
+            if device.lastTime > new.lastTime:
+                new.lastTime = device.lastTime
+            if device.rssiMagnitude < new.rssiMagnitude:
+                new.rssi = device.rssi
+                new.rssiMagnitude = device.rssiMagnitude
+            if device.manufacturer != new.manufacturer or \
+                device.essid != new.essid or device.channel != new.channel or \
+                device.auth != new.auth:
+                logger.warning("Conflicting information for %s", mac)
+
+    def _addWirelessClient(self, mac: str, device: WirelessClient) -> None:
+        """Adds a wireless client device record, merging it with any existing
+        record for the same MAC address
+        @param mac: MAC address of the device
+        @param device: Device record to add
+        """
+        new = self.wirelessClients.get(mac)
+        if new is None:
+            self.wirelessClients[mac] = device
+        else:
+            if device.firstTime < new.firstTime:
+                new.firstTime = device.firstTime
+            if device.lastTime > new.lastTime:
+                new.lastTime = device.lastTime
+            new.probedSsids.update(device.probedSsids)
+            if device.rssiMagnitude < new.rssiMagnitude:
+                new.rssi = device.rssi
+                new.rssiMagnitude = device.rssiMagnitude
+            if device.manufacturer != new.manufacturer or \
+                device.bssid != new.bssid:
+                logger.warning("Conflicting information for %s", mac)
+
+    def _mergeDevices(self, devices: dict, newDevices: dict,
+                      add: Callable) -> None:
+        """Merges a batch of device records into a device store, inserting
+        records for unseen MAC addresses in bulk and merging the rest
+        individually in input order. Inserted record objects are stored
+        as-is, not copied, and may be updated in place by later merges
+        @param devices: Device store to merge into
+        @param newDevices: Device records to merge keyed by MAC address
+        @param add: Method to merge a single record with
+        """
+        newDevices = dict(newDevices)
+        for mac in [mac for mac in newDevices if mac in devices]:
+            add(mac, newDevices.pop(mac))
+        devices.update(newDevices)
 
     def _processBluetooth(self, device: dict) -> None:
         """Processes data on a bluetooth device
         @param device: Dictionary containing device data to process
         """
+        mac = device.get('kismet_device_base_macaddr')
+        if mac is None:
+            logger.warning("Invalid bluetooth device record specified")
+            return
+        mac = str(mac).upper()
+        if not mac:
+            logger.warning("Device without MAC address detected")
+            return
         try:
-            mac = str(device['kismet_device_base_macaddr']).upper()
             firstTime = int(device['kismet_device_base_first_time'])
             lastTime = int(device['kismet_device_base_last_time'])
             manufacturer = str(device['kismet_device_base_manuf'])
             name = str(device['kismet_device_base_name'])
-        except:
+        except (KeyError, TypeError, ValueError):
             logger.warning("Invalid bluetooth device record specified")
             return
-        rssi = 5000
-        if not mac or mac is None:
-            logger.warning("Device without MAC address detected")
-            return
+        rssi = rssiMagnitude = 5000
         if not manufacturer or manufacturer is None:
             manufacturer = "Unknown"
         if not name or name is None:
             name = "Unknown"
-        if mac in self.bluetoothDevices.keys():
-            new = self.bluetoothDevices[mac]
-            new['firstTime'] = min(firstTime, new['firstTime'])
-            new['lastTime'] = max(lastTime, new['lastTime'])
-            if manufacturer != new['manufacturer'] or name != new['name']:
-                logger.warning(f"Conflicting information for {mac}")
-            self.bluetoothDevices[mac] = new
-        else:
-            self.bluetoothDevices[mac] = {
-                "firstTime": firstTime,
-                "lastTime": lastTime,
-                "manufacturer": manufacturer,
-                "name": name,
-                "rssi": rssi
-            }
+        self._addBluetooth(mac, BluetoothDevice(firstTime, lastTime,
+                                                sys.intern(manufacturer),
+                                                sys.intern(name), rssi,
+                                                rssiMagnitude))
     
+    def _processDevice(self, device: dict) -> None:
+        """Processes data on a device of any supported type
+        @param device: Dictionary containing device data to process
+        """
+        if not isinstance(device, dict):
+            logger.warning("Invalid device record specified")
+            return
+        deviceType = device.get('kismet_device_base_type')
+        processor = self._processors.get(deviceType)
+        if processor is None:
+            logger.warning("Device of unrecognised type '%s' detected",
+                           deviceType)
+            return
+        processor(self, device)
+
     def _processWirelessAp(self, device: dict) -> None:
         """Processes data on a wireless access point device
         @param device: Dictionary containing device data to process
         """
+        mac = device.get('kismet_device_base_macaddr')
+        if mac is None:
+            logger.warning("Invalid wireless access point device record " +
+                           "specified")
+            return
+        mac = str(mac).upper()
+        if not mac:
+            logger.warning("Device without MAC address detected")
+            return
         try:
-            mac = str(device['kismet_device_base_macaddr']).upper()
             firstTime = int(device['kismet_device_base_first_time'])
             lastTime = int(device['kismet_device_base_last_time'])
             manufacturer = str(device['kismet_device_base_manuf'])
             channel = int(device['kismet_device_base_channel'])
             auth = str(device['kismet_device_base_crypt'])
-            essid = str(device['dot11_device'][
-                        'dot11_device_last_beaconed_ssid_record'][
+            d11 = device['dot11_device']
+            essid = str(d11['dot11_device_last_beaconed_ssid_record'][
                         'dot11_advertisedssid_ssid'])
-        except:
+        except (KeyError, TypeError, ValueError):
             logger.warning("Invalid wireless access point device record " +
                            "specified")
             return
-        try:
-            if str(device['kismet_device_base_signal'][
-                          'kismet_common_signal_type']).lower() == "none":
-                rssi = 5000
-            else:
-                rssi = int(device['kismet_device_base_signal'][
-                                             'kismet_common_signal_max_signal'])
-        except:
-            rssi = 5000
-        if not mac or mac is None:
-            logger.warning("Device without MAC address detected")
-            return
+        rssi, rssiMagnitude = _signalStrength(device)
         if not manufacturer or manufacturer is None:
             manufacturer = "Unknown"
         if not auth or auth is None:
             auth = "Unknown"
         if not essid or essid is None:
             essid = "Unknown SSID"
-        if mac in self.wirelessAps.keys():
-            new = self.wirelessAps[mac]
-            new['firstTime'] = min(firstTime, new['firstTime'])
-            new['lastTime'] = max(lastTime, new['lastTime'])
-            new['rssi'] = rssi if abs(rssi) < abs(new['rssi']) else new['rssi']
-            if manufacturer != new['manufacturer'] or essid != new['essid'] or \
-                channel != new['channel'] or auth != new['auth']:
-                logger.warning(f"Conflicting information for {mac}")
-            self.wirelessAps[mac] = new
-        else:
-            self.wirelessAps[mac] = {
-                "firstTime": firstTime,
-                "lastTime": lastTime,
-                "manufacturer": manufacturer,
-                "channel": channel,
-                "auth": auth,
-                "essid": essid,
-                "rssi": rssi
-            }
+        essid = self._essidPool.setdefault(essid, essid)
+        self._addWirelessAp(mac, WirelessAp(firstTime, lastTime,
+                                            sys.intern(manufacturer), channel,
+                                            sys.intern(auth), essid, rssi,
+                                            rssiMagnitude))
 
     def _processWirelessClient(self, device: dict) -> None:
         """Processes data on a wireless client device
         @param device: Dictionary containing device data to process
         """
+        mac = device.get('kismet_device_base_macaddr')
+        if mac is None:
+            logger.warning("Invalid wireless client device record specified")
+            return
+        mac = str(mac).upper()
+        if not mac:
+            logger.warning("Device without MAC address detected")
+            return
         try:
-            mac = str(device['kismet_device_base_macaddr']).upper()
             firstTime = int(device['kismet_device_base_first_time'])
             lastTime = int(device['kismet_device_base_last_time'])
             manufacturer = str(device['kismet_device_base_manuf'])
-            bssid = str(device['dot11_device']['dot11_device_last_bssid'])
-            probedSsids = []
-            if "dot11_device_last_probed_ssid_record" in device['dot11_device'
-                                                                ].keys():
-                if device['dot11_device'][
-                                        'dot11_device_last_probed_ssid_record'][
-                                        'dot11_probedssid_ssid']:
-                    probedSsids.append(str(device['dot11_device'][
-                                        'dot11_device_last_probed_ssid_record'][
-                                        'dot11_probedssid_ssid']))
+            d11 = device['dot11_device']
+            bssid = str(d11['dot11_device_last_bssid'])
+            probedSsids = set()
+            probed = d11.get('dot11_device_last_probed_ssid_record')
+            if probed is not None:
+                probedSsid = probed['dot11_probedssid_ssid']
+                if probedSsid:
+                    probedSsids.add(str(probedSsid))
                 else:
-                    probedSsids.append("Unknown SSID")
-        except:
+                    probedSsids.add("Unknown SSID")
+        except (AttributeError, KeyError, TypeError, ValueError):
             logger.warning("Invalid wireless client device record specified")
             return
-        try:
-            if str(device['kismet_device_base_signal'][
-                          'kismet_common_signal_type']).lower() == "none":
-                rssi = 5000
-            else:
-                rssi = int(device['kismet_device_base_signal'][
-                                             'kismet_common_signal_max_signal'])
-        except:
-            rssi = 5000
-        if not mac or mac is None:
-            logger.warning("Device without MAC address detected")
-            return
+        rssi, rssiMagnitude = _signalStrength(device)
         if not manufacturer or manufacturer is None:
             manufacturer = "Unknown"
         if not bssid or bssid is None:
             bssid = "Unknown"
-        if mac in self.wirelessClients.keys():
-            new = self.wirelessClients[mac]
-            new['firstTime'] = min(firstTime, new['firstTime'])
-            new['lastTime'] = max(lastTime, new['lastTime'])
-            new['probedSsids'] = list(set(probedSsids + new['probedSsids']))
-            new['rssi'] = rssi if abs(rssi) < abs(new['rssi']) else new['rssi']
-            if manufacturer != new['manufacturer'] or bssid != new['bssid']:
-                logger.warning(f"Conflicting information for {mac}")
-            self.wirelessClients[mac] = new
-        else:
-            self.wirelessClients[mac] = {
-                "firstTime": firstTime,
-                "lastTime": lastTime,
-                "manufacturer": manufacturer,
-                "bssid": bssid,
-                "probedSsids": probedSsids,
-                "rssi": rssi
-            }
+        self._addWirelessClient(mac, WirelessClient(firstTime, lastTime,
+                                                    sys.intern(manufacturer),
+                                                    bssid, probedSsids, rssi,
+                                                    rssiMagnitude))
+
+    # Maps Kismet device types to the methods that process them
+    _processors = {
+        "BTLE": _processBluetooth,
+        "Wi-Fi AP": _processWirelessAp,
+        "Wi-Fi Client": _processWirelessClient
+    }
 
     def _reportBluetooth(self, outputDir: Path, filePrefix: str, format: str,
                          overwrite: bool) -> None:
@@ -200,31 +382,16 @@ class KismetParser():
         if outFile.exists() and not overwrite and not \
             self._yesNo(f"output file '{outFile}' exists, overwrite it?"):
             return
-        try:
-            with outFile.open('w') as f:
-                headings = ["MAC Address", "First Time", "Last Time",
-                            "Manufacturer", "Common Name", "RSSI"]
-                rows = []
-                for mac in self.bluetoothDevices.keys():
-                    row = [mac]
-                    row.append(self._epochToDatetime(self.bluetoothDevices[mac][
-                                                                  'firstTime']))
-                    row.append(self._epochToDatetime(self.bluetoothDevices[mac][
-                                                                   'lastTime']))
-                    row.append(self.bluetoothDevices[mac]['manufacturer'])
-                    row.append(self.bluetoothDevices[mac]['name'])
-                    if abs(self.bluetoothDevices[mac]['rssi']) > 255:
-                        row.append("Unknown")
-                    else:
-                        row.append(self.bluetoothDevices[mac]['rssi'])
-                    rows.append(row)
-                rows.sort(key=lambda x: f"{x[-1]} {x[0]}")
-                f.write(tabulate(rows, headings, format))
-        except:
-            error = f"Could not write to output file '{outFile}'"
-            logger.error(error)
-            raise Warning(error)
-        logger.debug(f"Bluetooth report written to '{outFile}'")
+        headings = ["MAC Address", "First Time", "Last Time",
+                    "Manufacturer", "Common Name", "RSSI"]
+        rows = [[mac, _epochToDatetime(rec.firstTime),
+                 _epochToDatetime(rec.lastTime), rec.manufacturer,
+                 rec.name,
+                 "Unknown" if rec.rssiMagnitude > 255 else rec.rssi]
+                for mac, rec in sorted(self.bluetoothDevices.items(),
+                                       key=_signalSortKey)]
+        self._writeReport(outFile, rows, headings, format)
+        logger.debug("Bluetooth report written to '%s'", outFile)
 
     def _reportWirelessAps(self, outputDir: Path, filePrefix: str, format: str,
                            overwrite: bool) -> None:
@@ -243,34 +410,18 @@ class KismetParser():
         if outFile.exists() and not overwrite and not \
             self._yesNo(f"output file '{outFile}' exists, overwrite it?"):
             return
-        try:
-            with outFile.open('w') as f:
-                headings = ["MAC Address", "First Time", "Last Time",
-                            "Manufacturer", "Channel", "Authentication",
-                            "ESSID", "RSSI"]
-                rows = []
-                for mac in self.wirelessAps.keys():
-                    row = [mac]
-                    row.append(self._epochToDatetime(self.wirelessAps[mac][
-                                                                  'firstTime']))
-                    row.append(self._epochToDatetime(self.wirelessAps[mac][
-                                                                   'lastTime']))
-                    row.append(self.wirelessAps[mac]['manufacturer'])
-                    row.append(self.wirelessAps[mac]['channel'])
-                    row.append(self.wirelessAps[mac]['auth'])
-                    row.append(self.wirelessAps[mac]['essid'])
-                    if abs(self.wirelessAps[mac]['rssi']) > 255:
-                        row.append("Unknown")
-                    else:
-                        row.append(self.wirelessAps[mac]['rssi'])
-                    rows.append(row)
-                rows.sort(key=lambda x: f"{x[-1]} {x[0]}")
-                f.write(tabulate(rows, headings, format))
-        except:
-            error = f"Could not write to output file '{outFile}'"
-            logger.error(error)
-            raise Warning(error)
-        logger.debug(f"Wireless access point report written to '{outFile}'")
+        headings = ["MAC Address", "First Time", "Last Time",
+                    "Manufacturer", "Channel", "Authentication",
+                    "ESSID", "RSSI"]
+        rows = [[mac, _epochToDatetime(rec.firstTime),
+                 _epochToDatetime(rec.lastTime), rec.manufacturer,
+                 rec.channel, rec.auth, rec.essid,
+                 "Unknown" if rec.rssiMagnitude > 255 else rec.rssi]
+                for mac, rec in sorted(self.wirelessAps.items(),
+                                       key=_signalSortKey)]
+        self._writeReport(outFile, rows, headings, format)
+        logger.debug("Wireless access point report written to '%s'",
+                     outFile)
 
     def _reportWirelessClients(self, outputDir: Path, filePrefix: str,
                                format: str, overwrite: bool) -> None:
@@ -289,46 +440,45 @@ class KismetParser():
         if outFile.exists() and not overwrite and not \
             self._yesNo(f"output file '{outFile}' exists, overwrite it?"):
             return
+        headings = ["MAC Address", "First Time", "Last Time",
+                    "Manufacturer", "BSSID", "Probed SSIDs", "RSSI"]
+        rows = [[mac, _epochToDatetime(rec.firstTime),
+                 _epochToDatetime(rec.lastTime), rec.manufacturer,
+                 rec.bssid, ', '.join(sorted(rec.probedSsids)),
+                 "Unknown" if rec.rssiMagnitude > 255 else rec.rssi]
+                for mac, rec in sorted(self.wirelessClients.items(),
+                                       key=_signalSortKey)]
+        self._writeReport(outFile, rows, headings, format)
+        logger.debug("Wireless client report written to '%s'", outFile)
+
+    def _writeReport(self, outFile: Path, rows: list, headings: list,
+                     format: str) -> None:
+        """Writes a report table to an output file
+        @param outFile: File to write the table to
+        @param rows: Table rows
+        @param headings: Table headings
+        @param format: Python-tabulate format for output tables
+        """
         try:
-            with outFile.open('w') as f:
-                headings = ["MAC Address", "First Time", "Last Time",
-                            "Manufacturer", "BSSID", "Probed SSIDs", "RSSI"]
-                rows = []
-                for mac in self.wirelessClients.keys():
-                    row = [mac]
-                    row.append(self._epochToDatetime(self.wirelessClients[mac][
-                                                                  'firstTime']))
-                    row.append(self._epochToDatetime(self.wirelessClients[mac][
-                                                                   'lastTime']))
-                    row.append(self.wirelessClients[mac]['manufacturer'])
-                    row.append(self.wirelessClients[mac]['bssid'])
-                    row.append(', '.join(self.wirelessClients[mac][
-                                                                'probedSsids']))
-                    if abs(self.wirelessClients[mac]['rssi']) > 255:
-                        row.append("Unknown")
-                    else:
-                        row.append(self.wirelessClients[mac]['rssi'])
-                    rows.append(row)
-                rows.sort(key=lambda x: f"{x[-1]} {x[0]}")
+            with outFile.open('w', buffering=65536, encoding='utf-8',
+                              newline='\n') as f:
                 f.write(tabulate(rows, headings, format))
-        except:
+        except OSError:
             error = f"Could not write to output file '{outFile}'"
             logger.error(error)
             raise Warning(error)
-        logger.debug(f"Wireless client report written to '{outFile}'")
     
     def _yesNo(self, prompt: str) -> bool:
         """Prompts the user for a yes/no response
         @param prompt: Prompt to display to the user
         @return: True if yes, False if no
         """
-        yn = input(f"{prompt} (y/n): ")
-        if yn.lower() == 'y':
-            return True
-        elif yn.lower() == 'n':
-            return False
-        else:
-            return self._yesNo(prompt)
+        while True:
+            yn = input(f"{prompt} (y/n): ").lower()
+            if yn == 'y':
+                return True
+            elif yn == 'n':
+                return False
     
     def addFile(self, file: Path) -> None:
         """Adds an input file to the parser
@@ -340,38 +490,71 @@ class KismetParser():
             logger.error(error)
             raise Warning(error)
         try:
-            with file.open() as f:
-                lines = f.readlines()
-        except:
+            with file.open('rb', buffering=65536) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        device = _loadDevice(line)
+                    except ValueError:
+                        error = f"Input file '{file}' is not a valid " + \
+                                "EKJSON file"
+                        logger.error(error)
+                        raise Warning(error)
+                    self._processDevice(device)
+        except OSError:
             error = f"Could not read input file '{file}'"
             logger.error(error)
             raise Warning(error)
-        for line in lines:
-            if line.strip():
-                try:
-                    self.devices.append(json.loads(line))
-                except:
-                    error = f"Input file '{file}' is not a valid EKJSON file"
-                    logger.error(error)
-                    raise Warning(error)
-        logger.debug(f"Input file '{file}' added successfully")
+        logger.debug("Input file '%s' added successfully", file)
+
+    def addFiles(self, files: list, workerInitializer: Callable = None) -> None:
+        """Adds multiple input files to the parser, parsing them concurrently
+        in separate processes. Conflicting information is reported within each
+        file and then when merging each file's results, so warnings can differ
+        from adding the files one at a time
+        @param files: Files to add
+        @param workerInitializer: Callable run at the start of each worker
+        process, e.g. to configure logging
+        """
+        if not files:
+            return
+        if len(files) == 1:
+            self.addFile(files[0])
+            return
+        workers = min(len(files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=workerInitializer) as executor:
+            try:
+                for results in executor.map(_parseFile, files):
+                    self.merge(*results)
+            except BaseException:
+                # Don't start parsing remaining files once one has failed
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def merge(self, bluetoothDevices: dict, wirelessAps: dict,
+              wirelessClients: dict) -> None:
+        """Merges device records parsed elsewhere into the parser, record
+        objects for new MAC addresses are taken over by the parser rather
+        than copied
+        @param bluetoothDevices: Bluetooth device records keyed by MAC address
+        @param wirelessAps: Wireless access point device records keyed by MAC
+        address
+        @param wirelessClients: Wireless client device records keyed by MAC
+        address
+        """
+        self._mergeDevices(self.bluetoothDevices, bluetoothDevices,
+                           self._addBluetooth)
+        self._mergeDevices(self.wirelessAps, wirelessAps, self._addWirelessAp)
+        self._mergeDevices(self.wirelessClients, wirelessClients,
+                           self._addWirelessClient)
     
     def parse(self) -> None:
-        """Parses data from input files"""
-        logger.debug("Initiated parsing of device data")
-        for device in self.devices:
-            match device['kismet_device_base_type']:
-                case "BTLE":
-                    self._processBluetooth(device)
-                case "Wi-Fi AP":
-                    self._processWirelessAp(device)
-                case "Wi-Fi Client":
-                    self._processWirelessClient(device)
-                case _:
-                    logger.warning("Device of unrecognised type '" +
-                                   device['kismet_device_base_type'] +
-                                   "' detected")
-                    continue
+        """Parses data from input files
+        Retained for compatibility, devices are now processed as each input
+        file is added
+        """
         logger.debug("Parsing complete")
     
     def report(self, outputDir: Path = Path("."), filePrefix: str = "",
@@ -407,6 +590,29 @@ class KismetParser():
         ], tablefmt="plain")
             
 
+def _configureLogging() -> None:
+    """Configures logging to stdout for the command line tool and its worker
+    processes
+    """
+    logHandlerStdout = logging.StreamHandler(sys.stdout)
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s - %(levelname)-7s - " +
+                "%(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logHandlerStdout]
+    )
+
+def _parseFile(file: Path) -> tuple:
+    """Parses a single input file, for use in worker processes
+    @param file: File to parse
+    @return: Tuple of bluetooth, wireless access point and wireless client
+    device records keyed by MAC address
+    """
+    kp = KismetParser()
+    kp.addFile(file)
+    return kp.bluetoothDevices, kp.wirelessAps, kp.wirelessClients
+
 def genArgParser() -> argparse.ArgumentParser:
     """Generates a CLI argument parser
     @return: CLI argument parser object
@@ -437,19 +643,10 @@ def main(cliArgs: list = sys.argv[1:]) -> None:
         genArgParser().print_usage()
         sys.exit()
     try:
-        logHandlerStdout = logging.StreamHandler(sys.stdout)
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)-7s - " +
-                    "%(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-            handlers=[logHandlerStdout]
-        )
+        _configureLogging()
         args = genArgParser().parse_args()
         kp = KismetParser()
-        for file in args.inputFiles:
-            kp.addFile(file)
-        kp.parse()
+        kp.addFiles(args.inputFiles, _configureLogging)
         kp.report(args.outputDir, args.outputPrefix, args.format,
                   args.overwrite)
         print("\nParsing complete!\n", kp.summarise(), "", sep="\n")